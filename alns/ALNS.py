@@ -1,12 +1,27 @@
+import copy
 import logging
-import time
+import math
 import os
+import shutil
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Protocol, Tuple
-import tqdm
-import numpy.random as rnd
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
 import numpy as np
-import shutil
+import numpy.random as rnd
 
 from alns.Outcome import Outcome
 from alns.Result import Result
@@ -14,8 +29,7 @@ from alns.State import State
 from alns.Statistics import Statistics
 from alns.accept import AcceptanceCriterion
 from alns.select import OperatorSelectionScheme
-from alns.stop import StoppingCriterion, MaxIterations
-from alns.My_plot import plot_solution
+from alns.stop import MaxIterations, MaxRuntime, StoppingCriterion
 
 
 class _OperatorType(Protocol):
@@ -40,6 +54,62 @@ class _CallbackType(Protocol):
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
+# Initial size of the per-iteration logs when the number of iterations is not
+# known upfront. The logs are grown as needed.
+_DEFAULT_LOG_CAPACITY = 1024
+
+# Maximum number of solution plots waiting to be rendered in the background.
+# Each holds a copy of a solution state, so this bounds the memory used when
+# plotting is slower than iterating.
+_MAX_PENDING_PLOTS = 8
+
+
+def _log_capacity(stop: StoppingCriterion) -> int:
+    """
+    Returns the number of iterations the per-iteration logs are preallocated
+    for. This is exact for the :class:`~alns.stop.MaxIterations` criterion.
+    """
+    if isinstance(stop, MaxIterations):
+        return stop.max_iterations
+
+    return _DEFAULT_LOG_CAPACITY
+
+
+def _bind(func: Callable, kwargs: Dict[str, Any]) -> Callable:
+    """
+    Binds the given keyword arguments to func. When there are none, func is
+    returned as-is, to avoid the overhead of an extra call layer.
+    """
+    return partial(func, **kwargs) if kwargs else func
+
+
+def _grow(logs: List[np.ndarray], capacity: int):
+    """
+    Resizes the given per-iteration logs in-place to hold ``capacity``
+    iterations. New entries are zero-initialised.
+    """
+    for log in logs:
+        log.resize((capacity, *log.shape[1:]), refcheck=False)
+
+
+def _make_plots_folder(printdir: str) -> str:
+    """
+    Creates a fresh, timestamped folder for the solution plots inside
+    ``printdir``, and returns its path. An existing folder with the same
+    timestamp is removed first. This is only called when plots are saved, so
+    runs without plots do not touch the filesystem.
+    """
+    plots_folder = f"{printdir}/{datetime.now().strftime('%Y%m%d%H%M')}"
+
+    if os.path.exists(plots_folder):
+        shutil.rmtree(plots_folder)
+        print(f"Removed existing folder {os.path.abspath(plots_folder)}")
+
+    os.makedirs(plots_folder)  # also creates printdir, if needed
+    print(f"Saving plots to folder {os.path.abspath(plots_folder)}")
+
+    return plots_folder
+
 
 class ALNS:
     """
@@ -65,7 +135,32 @@ class ALNS:
         Optional random number generator (RNG). When passed, this generator
         is used for operator selection and general computations requiring
         random numbers. It is also passed to the destroy and repair operators,
-        as a second argument.
+        as a second argument. When not passed, a new generator backed by the
+        fast ``SFC64`` bit generator is created for this instance. Operators
+        that make many scalar draws may benefit from wrapping the generator
+        in a :class:`~alns.BufferedGenerator.BufferedGenerator`, or from
+        drawing raw 64-bit integers directly from ``rng.bit_generator``
+        (e.g. via its ``random_raw()`` method).
+    eval_cache_size
+        Maximum number of objective values kept in the evaluation cache. When
+        the solution states implement ``fingerprint()`` (see
+        :class:`~alns.State.FingerprintedState`), the objective value of a
+        candidate solution that was seen before is taken from this cache,
+        rather than recomputed. The least recently used entries are evicted
+        first. Default 0, which disables the cache.
+
+        .. note::
+
+            The cache only replaces the evaluation ALNS itself performs. The
+            acceptance criteria (and callbacks) call ``objective()`` on the
+            candidate directly, so states with expensive objectives should
+            also memoise ``objective()`` themselves.
+    track_operator_deltas
+        Whether to log the number of customers removed and inserted by the
+        destroy and repair operators in each iteration. This requires the
+        solution states to maintain an ``unassigned`` list of customers.
+        Default False, in which case :meth:`~alns.ALNS.ALNS.iterate` returns
+        ``None`` for these logs.
 
     References
     ----------
@@ -74,14 +169,38 @@ class ALNS:
            - 420). Springer.
     """
 
-    def __init__(self, rng: rnd.Generator = rnd.default_rng()):
-        self._rng = rng
+    __slots__ = (
+        "_d_ops",
+        "_eval_cache",
+        "_eval_cache_size",
+        "_fused_ops",
+        "_on_outcome",
+        "_r_ops",
+        "_rng",
+        "_track_deltas",
+    )
+
+    def __init__(
+        self,
+        rng: Optional[rnd.Generator] = None,
+        eval_cache_size: int = 0,
+        track_operator_deltas: bool = False,
+    ):
+        if eval_cache_size < 0:
+            raise ValueError("eval_cache_size < 0 not understood.")
+
+        self._rng = rng if rng is not None else rnd.Generator(rnd.SFC64())
+        self._eval_cache_size = eval_cache_size
+        self._eval_cache: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._track_deltas = track_operator_deltas
 
         self._d_ops: Dict[str, _OperatorType] = {}
         self._r_ops: Dict[str, _OperatorType] = {}
+        self._fused_ops: Dict[Tuple[str, str], _OperatorType] = {}
 
-        # Registers callback for each possible evaluation outcome.
-        self._on_outcome: Dict[Outcome, _CallbackType] = {}
+        # Registers callback for each possible evaluation outcome, indexed by
+        # the outcome's value.
+        self._on_outcome: List[Optional[_CallbackType]] = [None] * len(Outcome)
 
     @property
     def destroy_operators(self) -> List[Tuple[str, _OperatorType]]:
@@ -109,6 +228,20 @@ class ALNS:
         """
         return list(self._r_ops.items())
 
+    @property
+    def fused_operators(self) -> List[Tuple[Tuple[str, str], _OperatorType]]:
+        """
+        Returns the fused operators set for the ALNS algorithm.
+
+        Returns
+        -------
+        list
+            A list of ((destroy name, repair name), operator) tuples. Their
+            order is the same as the one in which they were passed to the
+            ALNS instance.
+        """
+        return list(self._fused_ops.items())
+
     def add_destroy_operator(
         self, op: _OperatorType, name: Optional[str] = None
     ):
@@ -122,6 +255,11 @@ class ALNS:
             a **copy** of this state in the destroy operator, created using,
             for example, :func:`copy.copy` or :func:`copy.deepcopy`.
 
+            When the solution states implement ``clone()`` (see
+            :class:`~alns.State.CloneableState`), the destroy operator instead
+            receives a clone of the current solution, which it may modify
+            in-place.
+
         Parameters
         ----------
         op
@@ -154,13 +292,56 @@ class ALNS:
         logger.debug(f"Adding repair operator {op.__name__}.")
         self._r_ops[name if name else op.__name__] = op
 
+    def add_fused_operator(self, op: _OperatorType, destroy: str, repair: str):
+        """
+        Adds a fused operator that performs both the destroy and the repair
+        step of the given pair of destroy and repair operators in a single
+        call. Whenever the operator selection scheme selects this pair, the
+        fused operator is applied instead of the two separate operators. This
+        avoids constructing the intermediate destroyed state, and allows the
+        operator to reuse scratch data between both steps.
+
+        Parameters
+        ----------
+        op
+            An operator that, when applied to the current state, returns a new
+            state reflecting the combined destroy and repair action. Like a
+            destroy operator, it receives the current solution (or a clone,
+            see :meth:`~alns.ALNS.ALNS.add_destroy_operator`). Its second
+            argument is the RNG passed to the ALNS instance.
+        destroy
+            Name of the destroy operator this operator replaces.
+        repair
+            Name of the repair operator this operator replaces.
+
+        Raises
+        ------
+        ValueError
+            When the destroy or repair operator has not been added, or when
+            operator deltas are tracked, since those require the intermediate
+            destroyed state.
+        """
+        if destroy not in self._d_ops:
+            raise ValueError(f"Unknown destroy operator {destroy}.")
+
+        if repair not in self._r_ops:
+            raise ValueError(f"Unknown repair operator {repair}.")
+
+        if self._track_deltas:
+            raise ValueError(
+                "Fused operators with track_operator_deltas not understood."
+            )
+
+        logger.debug(f"Adding fused operator {op.__name__}.")
+        self._fused_ops[destroy, repair] = op
+
     def iterate(
         self,
         initial_solution: State,
         op_select: OperatorSelectionScheme,
         accept: AcceptanceCriterion,
         stop: StoppingCriterion,
-        data: dict = None,
+        data: Optional[dict] = None,
         save_plots: bool = False,
         printdir: str = "./outputs/plots",
         **kwargs,
@@ -195,9 +376,16 @@ class ALNS:
 
         Returns
         -------
-        Result
-            A result object, containing the best solution and some additional
-            statistics.
+        tuple
+            A tuple of the result object, containing the best solution and
+            some additional statistics; the number of customers removed by
+            the destroy operator and inserted by the repair operator in each
+            iteration (``None`` unless ``track_operator_deltas`` is set);
+            the indices of the selected destroy and repair
+            operators in each iteration; and the cost of the current solution
+            after each iteration. Together, the operator indices and customer
+            counts form a sparse log of each operator's effect, which can be
+            expanded using :meth:`~alns.Result.Result.to_dense`.
 
         References
         ----------
@@ -209,100 +397,311 @@ class ALNS:
                class of vehicle routing problems with backhauls. *European
                Journal of Operational Research*, 171: 750-775.
         """
-        if len(self.destroy_operators) == 0 or len(self.repair_operators) == 0:
+        if not self._d_ops or not self._r_ops:
             raise ValueError("Missing destroy or repair operators.")
 
         curr = best = initial_solution
-        init_obj = initial_solution.objective()
 
-        logger.debug(f"Initial solution has objective {init_obj:.2f}.")
+        # Cached objective values are only valid for a single run.
+        self._eval_cache.clear()
+        use_cache = self._eval_cache_size > 0 and callable(
+            getattr(initial_solution, "fingerprint", None)
+        )
+        use_clone = callable(getattr(initial_solution, "clone", None))
+
+        # Objective values of the best and current solutions. These are
+        # tracked here so each state is evaluated only once. The initial
+        # solution also seeds the evaluation cache, since candidates often
+        # return to it.
+        if use_cache:
+            init_obj = self._evaluate(initial_solution)
+        else:
+            init_obj = initial_solution.objective()
+
+        best_obj = curr_obj = init_obj
+
+        # Cost of the current solution. Like its objective, this only changes
+        # when a candidate is accepted, so it is not read again otherwise.
+        # States are not required to have a cost, in which case NaN is logged.
+        curr_cost = getattr(initial_solution, "cost", np.nan)
+
+        logger.debug("Initial solution has objective %.2f.", init_obj)
 
-        stats = Statistics()
-        stats.collect_objective(init_obj)
-        stats.collect_runtime(time.perf_counter())
+        start_time = time.perf_counter_ns()
         # added by me
         iteration = 0
-        #destruction_counts = np.zeros(
-        #    shape=(stop._max_iterations, len(self.destroy_operators) + 1),
-        #    dtype=int,
-        #)
-        #destruction_counts[0, :] = 0
-        #insertion_counts = np.zeros(
-        #    shape=(stop._max_iterations, len(self.repair_operators) + 1),
-        #    dtype=int,
-        #)
-        #insertion_counts[0, :] = 0
-
-        d_operator_log = []
-        r_operator_log = []
+        capacity = _log_capacity(stop)
+
+        # Number of customers removed by the destroy operator and inserted by
+        # the repair operator in each iteration, and the current solution
+        # cost. Together with the operator logs below, these form one array
+        # per column of the (iteration, operator, count) log. The counts are
+        # bounded by the number of customers, so 32 bits suffice. They stay
+        # signed, since operators may also leave more customers unassigned
+        # than they were given. The costs are (float) route distances, and
+        # keep their own array.
+        track_deltas = self._track_deltas
+        n_removed = np.zeros(capacity if track_deltas else 0, dtype=np.int32)
+        n_inserted = np.zeros(capacity if track_deltas else 0, dtype=np.int32)
+        cost_per_iter = np.zeros(capacity, dtype=np.float64)
+
+        # Indices of the selected destroy and repair operators. The smallest
+        # integer type that fits all operator indices is used.
+        d_operator_log = np.zeros(
+            capacity, dtype=np.min_scalar_type(len(self._d_ops))
+        )
+        r_operator_log = np.zeros(
+            capacity, dtype=np.min_scalar_type(len(self._r_ops))
+        )
+
+        # Objective value of the current solution, end time, and outcome of
+        # each iteration. These are turned into statistics after iterating.
+        # End times are integer nanoseconds, which avoids creating a float
+        # object for every timestamp.
+        objectives = np.zeros(capacity, dtype=np.float64)
+        runtimes = np.zeros(capacity, dtype=np.int64)
+        outcomes = np.zeros(capacity, dtype=np.int8)
+
+        logs = [
+            cost_per_iter,
+            d_operator_log,
+            r_operator_log,
+            objectives,
+            runtimes,
+            outcomes,
+        ]
+
+        if track_deltas:
+            logs += [n_removed, n_inserted]
 
         # set up plot directory
         if save_plots:
-            logger.debug(f"\nsave_plots is True\n")
-            if not os.path.exists(printdir):
-                os.makedirs(printdir)
-            id = datetime.now().strftime("%Y%m%d%H%M")
-            plots_folder = f"{printdir}/{id}"
-            if os.path.exists(plots_folder):
-                # remove folder
-                shutil.rmtree(plots_folder)
-                print(f"Removed existing folder {os.path.abspath(plots_folder)}")
-            os.makedirs(plots_folder)
-            print(f"Saving plots to folder {os.path.abspath(plots_folder)}")
-        while not stop(self._rng, best, curr):
-            logger.debug(f"\n")
-            logger.debug(f"Iteration: {iteration}")
-            d_idx, r_idx = op_select(self._rng, best, curr)
-
-            d_name, d_operator = self.destroy_operators[d_idx]
-            r_name, r_operator = self.repair_operators[r_idx]
-            logger.debug(
-                f"Current unassigned list: {curr.unassigned}."
+            # Matplotlib is only loaded when plots are saved.
+            from matplotlib.figure import Figure
+
+            from alns.My_plot import plot_solution
+
+            plots_folder = _make_plots_folder(printdir)
+
+            # Plots are rendered and written in the background, so the search
+            # does not wait on matplotlib. A single worker keeps matplotlib
+            # use serialised, which also allows all plots to reuse one figure.
+            plot_pool = ThreadPoolExecutor(max_workers=1)
+            pending_plots: Deque[Future] = deque()
+            plot_ax = Figure(figsize=(12, 10)).subplots()
+
+        # The operators do not change while iterating, so they are collected
+        # once rather than in every iteration. Names and operators are kept in
+        # separate tuples, since the names are only needed for debug logging.
+        # The keyword arguments are bound to the operators and callbacks here
+        # as well, so they are not unpacked again in each call.
+        d_names = tuple(self._d_ops)
+        d_ops = tuple(_bind(op, kwargs) for op in self._d_ops.values())
+        r_names = tuple(self._r_ops)
+        r_ops = tuple(_bind(op, kwargs) for op in self._r_ops.values())
+        on_outcome = [
+            None if func is None else _bind(func, kwargs)
+            for func in self._on_outcome
+        ]
+
+        # Fused operators, indexed by the destroy and repair operator indices
+        # of the pair they replace. Pairs without a fused operator are None.
+        fused = tuple(
+            tuple(
+                _bind(self._fused_ops[d_name, r_name], kwargs)
+                if (d_name, r_name) in self._fused_ops
+                else None
+                for r_name in r_names
             )
-            logger.debug(
-                f"destroy operator is {d_name}, repair operator is {r_name}."
-            )
-            # logging chosen operators
-            d_operator_log.append(d_idx)
-            r_operator_log.append(r_idx)
-
-            # calculating the number of customers removed and added and logging
-            n_served_customers1 = curr.n_served_customers()
-
-            logger.debug(f"Calling destroy operator {d_name}.")
-            destroyed = d_operator(curr, self._rng, **kwargs)
-            # DEBUG
-            logger.debug(f"Calling repair operator {r_name}.")
-            
-            n_served_customers2 = destroyed.n_served_customers()
-            cand = r_operator(destroyed, self._rng, **kwargs)
-            n_served_customers3 = cand.n_served_customers()
-
-            best, curr, outcome = self._eval_cand(
-                accept,
-                best,
-                curr,
-                cand,
-                data,
-                iteration,
-                save=False,
-                **kwargs,
-            )
-            op_select.update(cand, d_idx, r_idx, outcome)
-
-            stats.collect_objective(curr.objective())
-            stats.collect_destroy_operator(d_name, outcome)
-            stats.collect_repair_operator(r_name, outcome)
-            stats.collect_runtime(time.perf_counter())
+            for d_name in d_names
+        )
+
+        # Checked once, so disabled log messages cost nothing per iteration.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        info = logger.isEnabledFor(logging.INFO)
+
+        # Names used in every iteration are bound to locals, which are faster
+        # to look up than attributes and globals.
+        rng = self._rng
+        select = op_select.__call__
+        update = op_select.update
+        is_accepted = accept.__call__
+        evaluate = self._evaluate
+        perf_counter_ns = time.perf_counter_ns
+        BEST = Outcome.BEST
+        BETTER = Outcome.BETTER
+        ACCEPT = Outcome.ACCEPT
+        REJECT = Outcome.REJECT
+
+        # The built-in iteration and runtime criteria amount to comparisons
+        # against the iteration counter and the timestamps the loop already
+        # records, so those are checked directly rather than by calling the
+        # criterion in every iteration. Subclasses may override __call__, so
+        # only exact instances are specialised.
+        max_iterations = max_runtime = math.inf
+        call_stop = False
+
+        if type(stop) is MaxIterations:
+            max_iterations = stop.max_iterations
+        elif type(stop) is MaxRuntime:
+            max_runtime = stop.max_runtime * 1e9  # in nanoseconds
+        else:
+            call_stop = True
+            stop = stop.__call__
+
+        # A fresh timestamp, so the first check already accounts for the time
+        # spent so far. The strict comparison ensures a zero runtime limit
+        # never runs an iteration, as with MaxRuntime itself.
+        now = perf_counter_ns()
+
+        try:
+            while (
+                iteration < max_iterations
+                and now - start_time < max_runtime
+                and not (call_stop and stop(rng, best, curr))
+            ):
+                if iteration == capacity:
+                    capacity = max(2 * capacity, 1)
+                    _grow(logs, capacity)
+
+                d_idx, r_idx = select(rng, best, curr)
+
+                d_operator = d_ops[d_idx]
+                r_operator = r_ops[r_idx]
+
+                if debug:
+                    logger.debug("Iteration: %d", iteration)
+                    logger.debug(
+                        "Current unassigned list: %s.", curr.unassigned
+                    )
+                    logger.debug(
+                        "destroy operator is %s, repair operator is %s.",
+                        d_names[d_idx],
+                        r_names[r_idx],
+                    )
+
+                # logging chosen operators
+                d_operator_log[iteration] = d_idx
+                r_operator_log[iteration] = r_idx
+
+                # The number of customers removed and inserted follows from the
+                # change in unassigned customers, which operators maintain.
+                if track_deltas:
+                    n_unassigned_curr = len(curr.unassigned)
+
+                state = curr.clone() if use_clone else curr
+                fused_operator = fused[d_idx][r_idx]
+
+                if fused_operator is not None:
+                    cand = fused_operator(state, rng)
+                else:
+                    destroyed = d_operator(state, rng)
+                    if track_deltas:
+                        n_unassigned_destroyed = len(destroyed.unassigned)
+
+                    cand = r_operator(destroyed, rng)
+
+                    if track_deltas:
+                        n_unassigned_cand = len(cand.unassigned)
+                        n_removed[iteration] = (
+                            n_unassigned_destroyed - n_unassigned_curr
+                        )
+                        n_inserted[iteration] = (
+                            n_unassigned_destroyed - n_unassigned_cand
+                        )
+
+                cand_obj = evaluate(cand) if use_cache else cand.objective()
+
+                # The acceptance criterion is always consulted, also for a new
+                # best, since criteria may update their state on each call.
+                accepted = is_accepted(rng, best, curr, cand)
+
+                if cand_obj < best_obj:  # candidate is new best
+                    outcome = BEST
+                elif not accepted:
+                    outcome = REJECT
+                elif cand_obj < curr_obj:
+                    outcome = BETTER
+                else:
+                    outcome = ACCEPT
+
+                func = on_outcome[outcome]
+
+                if func is not None:
+                    func(cand, rng)
+
+                    # Callbacks may modify the candidate solution in-place.
+                    cand_obj = cand.objective()
+
+                if outcome == BEST:
+                    if info:
+                        logger.info("New best with objective %.2f.", cand_obj)
+
+                    best = curr = cand
+                    best_obj = curr_obj = cand_obj
+                    curr_cost = getattr(cand, "cost", np.nan)
+                elif outcome != REJECT:
+                    curr = cand
+                    curr_obj = cand_obj
+                    curr_cost = getattr(cand, "cost", np.nan)
+
+                update(cand, d_idx, r_idx, outcome)
+                cost_per_iter[iteration] = curr_cost
+
+                objectives[iteration] = curr_obj
+                outcomes[iteration] = outcome
+                runtimes[iteration] = now = perf_counter_ns()
+                if save_plots:
+                    # Finished plots are dropped, and when too many are still
+                    # pending, we wait for the oldest. Calling result() also
+                    # raises any exception from rendering or saving a plot.
+                    while pending_plots and (
+                        pending_plots[0].done()
+                        or len(pending_plots) >= _MAX_PENDING_PLOTS
+                    ):
+                        pending_plots.popleft().result()
+
+                    future = plot_pool.submit(
+                        plot_solution,
+                        copy.deepcopy(curr),
+                        f"solution_{iteration:04d}.png",
+                        save=True,
+                        save_path=plots_folder,
+                        ax=plot_ax,
+                    )
+                    pending_plots.append(future)
+                iteration += 1
+        finally:
+            # Also stops the worker when an operator raises while iterating.
             if save_plots:
-                plot_solution(curr, f"solution_{iteration:04d}.png", save=True, save_path=plots_folder)
-            iteration += 1
+                plot_pool.shutdown(wait=True)
 
-        logger.info(f"Finished iterating in {stats.total_runtime:.2f}s.")
-
-            #return Result(best, stats), destruction_counts, insertion_counts, np.array(d_operator_log), np.array(r_operator_log)
-        logger.debug(f"Finished in {iteration} iterations and {stats.total_runtime:.2f}s")
-        return Result(best, stats), None, None, np.array(d_operator_log), np.array(r_operator_log)
+        if save_plots:
+            # Re-raises any exception from rendering or saving a plot.
+            for future in pending_plots:
+                future.result()
+
+        stats = Statistics.from_traces(
+            np.concatenate(([init_obj], objectives[:iteration])),
+            np.concatenate(([start_time], runtimes[:iteration])) / 1e9,
+            list(d_names),
+            list(r_names),
+            d_operator_log[:iteration],
+            r_operator_log[:iteration],
+            outcomes[:iteration],
+        )
+
+        logger.info("Finished iterating in %.2fs.", stats.total_runtime)
+        logger.debug("Finished in %d iterations.", iteration)
+
+        return (
+            Result(best, stats),
+            n_removed[:iteration] if track_deltas else None,
+            n_inserted[:iteration] if track_deltas else None,
+            d_operator_log[:iteration],
+            r_operator_log[:iteration],
+            cost_per_iter[:iteration],
+        )
 
     def on_best(self, func: _CallbackType):
         """
@@ -336,69 +735,22 @@ class ALNS:
         logger.debug(f"Adding on_reject callback {func.__name__}.")
         self._on_outcome[Outcome.REJECT] = func
 
-    def _eval_cand(
-        self,
-        accept: AcceptanceCriterion,
-        best: State,
-        curr: State,
-        cand: State,
-        data: dict,
-        iteration: int,
-        save: bool = False,
-        **kwargs,
-    ) -> Tuple[State, State, Outcome]:
-        """
-        Considers the candidate solution by comparing it against the best and
-        current solutions. Candidate solutions are accepted based on the
-        passed-in acceptance criterion. The (possibly new) best and current
-        solutions are returned, along with a weight index (best, better,
-        accepted, rejected).
-
-        Returns
-        -------
-        tuple
-            A tuple of the best and current solution, along with the weight
-            index.
-        """
-        outcome = self._determine_outcome(accept, best, curr, cand)
-        func = self._on_outcome.get(outcome)
-
-        if callable(func):
-            func(cand, self._rng, **kwargs)
-
-        if outcome == Outcome.BEST:
-            if save:
-                logger.debug(f"Iteration {iteration} is new best")
-                plot_solution(
-                    data, best, f"solution_{iteration:04d}.png", save=True
-                )
-            return cand, cand, outcome
-
-        if outcome == Outcome.REJECT:
-            return best, curr, outcome
-
-        return best, cand, outcome
-
-    def _determine_outcome(
-        self,
-        accept: AcceptanceCriterion,
-        best: State,
-        curr: State,
-        cand: State,
-    ) -> Outcome:
+    def _evaluate(self, state: State) -> float:
         """
-        Determines the candidate solution's evaluation outcome.
+        Returns the objective value of the given fingerprinted state, using
+        the evaluation cache when the state has been seen before.
         """
-        outcome = Outcome.REJECT
+        key = state.fingerprint()  # type: ignore[attr-defined]
+        objective = self._eval_cache.get(key)
 
-        if accept(self._rng, best, curr, cand):  # accept candidate
-            outcome = Outcome.ACCEPT
+        if objective is not None:
+            self._eval_cache.move_to_end(key)
+            return objective
 
-            if cand.objective() < curr.objective():
-                outcome = Outcome.BETTER
+        objective = state.objective()
+        self._eval_cache[key] = objective
 
-        if cand.objective() < best.objective():  # candidate is new best
-            logger.info(f"New best with objective {cand.objective():.2f}.")
-            outcome = Outcome.BEST
+        if len(self._eval_cache) > self._eval_cache_size:
+            self._eval_cache.popitem(last=False)
 
-        return outcome
+        return objective
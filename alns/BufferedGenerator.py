@@ -0,0 +1,99 @@
+from typing import Any, Optional
+
+from numpy.random import Generator
+
+
+class BufferedGenerator:
+    """
+    Wrapper around a NumPy random number generator that serves scalar
+    :meth:`random` and :meth:`integers` draws from a buffer of uniform random
+    numbers. The buffer is refilled in a single vectorised call when it runs
+    out, which amortises NumPy's per-call overhead over many scalar draws.
+    All other attributes and methods are forwarded to the wrapped generator.
+
+    .. note::
+
+        Since uniform numbers are drawn from the wrapped generator in batches,
+        mixing buffered and forwarded draws results in a different (but still
+        reproducible) random number stream than using the wrapped generator
+        directly.
+
+    Parameters
+    ----------
+    rng
+        The random number generator to wrap.
+    buffer_size
+        Number of uniform random numbers to draw at once. Default 4096.
+    """
+
+    def __init__(self, rng: Generator, buffer_size: int = 4096):
+        if buffer_size < 1:
+            raise ValueError("buffer_size < 1 not understood.")
+
+        self._rng = rng
+        self._buffer_size = buffer_size
+        self._buffer: list = []
+        self._idx = 0
+
+    @property
+    def buffer_size(self) -> int:
+        return self._buffer_size
+
+    def random(self, size: Optional[Any] = None, **kwargs):
+        """
+        Returns a uniform random float in [0, 1) from the buffer. Calls that
+        pass a size (or any other argument) are forwarded to the wrapped
+        generator's :meth:`~numpy.random.Generator.random`.
+        """
+        if size is not None or kwargs:
+            return self._rng.random(size, **kwargs)
+
+        if self._idx == len(self._buffer):
+            # Python floats are much faster to index and return one at a time
+            # than NumPy scalars, so the buffer is stored as a list.
+            self._buffer = self._rng.random(self._buffer_size).tolist()
+            self._idx = 0
+
+        value = self._buffer[self._idx]
+        self._idx += 1
+
+        return value
+
+    def integers(
+        self,
+        low: int,
+        high: Optional[int] = None,
+        size: Optional[Any] = None,
+        endpoint: bool = False,
+        **kwargs,
+    ):
+        """
+        Returns a random integer in [low, high) - or [0, low) when high is not
+        given - using a uniform number from the buffer. Calls that pass a size
+        (or any other argument) are forwarded to the wrapped generator's
+        :meth:`~numpy.random.Generator.integers`.
+        """
+        if size is not None or kwargs:
+            return self._rng.integers(
+                low, high, size, endpoint=endpoint, **kwargs
+            )
+
+        if high is None:
+            low, high = 0, low
+
+        if endpoint:
+            high += 1
+
+        if high <= low:
+            raise ValueError("high <= low not understood.")
+
+        return low + int(self.random() * (high - low))
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not found on this object. The check
+        # avoids infinite recursion when _rng is not yet set, e.g. while
+        # copying or unpickling.
+        if name == "_rng":
+            raise AttributeError(name)
+
+        return getattr(self._rng, name)
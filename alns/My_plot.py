@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-
 def plot_solution(
     solution,
     name="CVRP solution",
@@ -8,6 +6,7 @@ def plot_solution(
     save=False,
     save_path="./outputs/plots",
     cordeau: bool = True,
+    ax=None,
 ):
     """
     Plot the routes of the passed-in solution. If cordeau is True, the first customer is ignored.
@@ -21,33 +20,63 @@ def plot_solution(
             figsize: tuple
                 The size of the plot.
             save: bool
-                If True, the plot is saved in "./plots".
+                If True, the plot is saved in save_path instead of shown. The
+                figure is then created without pyplot, so saving is safe from
+                a background thread.
             cordeau: bool
                 If True, the first customer is ignored.
+            ax: matplotlib.axes.Axes
+                Optional axes to draw on. The axes are cleared first, so one
+                figure can be reused for many plots. figsize is then ignored.
 
     """
+    # Matplotlib is imported here, so it is only loaded when plotting.
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+
     df = solution.nodes_df
+    # Snapshot of all coordinates, so locations can be gathered by plain NumPy
+    # indexing instead of pandas lookups.
+    xy = df[["x", "y"]].to_numpy()
+
+    def gather_xy(locations):
+        idcs = df.index.get_indexer(locations)
+
+        if (idcs < 0).any():  # get_indexer returns -1 for unknown labels
+            missing = [loc for loc, idx in zip(locations, idcs) if idx < 0]
+            raise KeyError(f"Locations {missing} not in nodes_df.")
+
+        return xy[idcs]
+
     start_idx = 1 if cordeau else 0
-    fig, ax = plt.subplots(figsize=figsize)
+    if ax is not None:
+        ax.clear()
+        fig = ax.figure
+    elif save:
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
+    else:
+        fig, ax = plt.subplots(figsize=figsize)
+
     cmap = plt.get_cmap("Set2", len(solution.routes))
-    cmap
     # Plot the routes
     for idx, route in enumerate(solution.routes):
+        route_xy = gather_xy(route.customers_list)
         ax.plot(
-            [df.loc[loc, "x"].item() for loc in route.customers_list],
-            [df.loc[loc, "y"].item() for loc in route.customers_list],
+            route_xy[:, 0],
+            route_xy[:, 1],
             color=cmap(idx),
             marker=".",
             label=f"Vehicle {route.vehicle}",
         )
 
-    # Plot the customers
-    for i in range(start_idx, solution.n_customers + 1):
-        customer = df.loc[i, ["x", "y"]]
-        # customer = customer.values[0]
-        ax.plot(customer.iloc[0], customer.iloc[1], "o", c="tab:blue")
-        if idx_annotations:
-            ax.annotate(i, (customer[0], customer[1]))
+    # Plot the customers, as a single scatter rather than one line each
+    customers = range(start_idx, solution.n_customers + 1)
+    customers_xy = gather_xy(customers)
+    ax.scatter(customers_xy[:, 0], customers_xy[:, 1], c="tab:blue")
+    if idx_annotations:
+        for i, (x, y) in zip(customers, customers_xy):
+            ax.annotate(i, (x, y))
 
     # Plot the depot
     kwargs = dict(zorder=3, marker="X")
@@ -66,5 +95,4 @@ def plot_solution(
     ax.legend(frameon=False, ncol=3)
 
     if save:
-        plt.savefig(f"{save_path}/{name}.png")
-        plt.close()
+        fig.savefig(f"{save_path}/{name}.png")
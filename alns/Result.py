@@ -1,12 +1,15 @@
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.pyplot import Axes, Figure
 
 from alns.State import State
 from alns.Statistics import Statistics
 
+if TYPE_CHECKING:
+    # Matplotlib is only imported when plotting, so importing this module
+    # does not initialise a plotting backend.
+    from matplotlib.pyplot import Axes, Figure
+
 
 class Result:
     """
@@ -39,9 +42,41 @@ class Result:
         """
         return self._statistics
 
+    @staticmethod
+    def to_dense(
+        indices: np.ndarray, counts: np.ndarray, num_operators: int
+    ) -> np.ndarray:
+        """
+        Expands the per-iteration operator indices and customer counts
+        returned by :meth:`~alns.ALNS.ALNS.iterate` into a dense matrix.
+
+        Parameters
+        ----------
+        indices
+            Index of the (destroy or repair) operator applied in each
+            iteration.
+        counts
+            Number of customers removed or inserted in each iteration.
+        num_operators
+            Number of destroy or repair operators.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of shape (num_iterations, num_operators), where entry
+            (i, j) is the number of customers removed or inserted by operator
+            j in iteration i, and zero if operator j was not applied then.
+            The column sums give the totals per operator.
+        """
+        counts = np.asarray(counts)
+        dense = np.zeros((len(counts), num_operators), dtype=counts.dtype)
+        dense[np.arange(len(counts)), indices] = counts
+
+        return dense
+
     def plot_objectives(
         self,
-        ax: Optional[Axes] = None,
+        ax: Optional["Axes"] = None,
         title: Optional[str] = None,
         **kwargs: Dict[str, Any]
     ):
@@ -58,6 +93,8 @@ class Result:
         kwargs
             Optional arguments passed to ``ax.plot``.
         """
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
 
@@ -79,7 +116,7 @@ class Result:
 
     def plot_operator_counts(
         self,
-        fig: Optional[Figure] = None,
+        fig: Optional["Figure"] = None,
         title: Optional[str] = None,
         legend: Optional[List[str]] = None,
         **kwargs: Dict[str, Any]
@@ -106,6 +143,8 @@ class Result:
         kwargs
             Optional arguments passed to each call of ``ax.barh``.
         """
+        import matplotlib.pyplot as plt
+
         if fig is None:
             fig, (d_ax, r_ax) = plt.subplots(nrows=2)
             fig.subplots_adjust(hspace=0.7, bottom=0.2)
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Hashable, Protocol
 
 import numpy as np
 
@@ -27,3 +27,37 @@ class ContextualState(State, Protocol):
         Computes a context vector for the current state.
         """
         ...  # pragma: no cover
+
+
+class FingerprintedState(State, Protocol):
+    """
+    Protocol for a solution state that can be fingerprinted. Solutions should
+    define ``objective()`` and ``fingerprint()`` methods. Structurally
+    identical solutions must have equal fingerprints, which allows the ALNS
+    algorithm to reuse the objective value of previously seen solutions, when
+    its evaluation cache is enabled.
+    """
+
+    def fingerprint(self) -> Hashable:
+        """
+        Computes a cheap, hashable key identifying this state, for example a
+        tuple of the routes in a vehicle routing solution.
+        """
+        ...  # pragma: no cover
+
+
+class CloneableState(State, Protocol):
+    """
+    Protocol for a solution state that can be cloned cheaply. Solutions should
+    define ``objective()`` and ``clone()`` methods. When available, the ALNS
+    algorithm passes a clone of the current solution to the destroy operator,
+    which may then modify it in-place.
+    """
+
+    def clone(self) -> State:
+        """
+        Returns a copy of this state that can be modified without affecting
+        the original, for example by copying the route lists but sharing
+        immutable problem data.
+        """
+        ...  # pragma: no cover
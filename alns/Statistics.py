@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import DefaultDict, List
+from typing import DefaultDict, List, Sequence, Tuple
 
 import numpy as np
 
@@ -19,6 +19,64 @@ class Statistics:
         self._destroy_operator_counts = defaultdict(lambda: [0, 0, 0, 0])
         self._repair_operator_counts = defaultdict(lambda: [0, 0, 0, 0])
 
+    @classmethod
+    def from_traces(
+        cls,
+        objectives: np.ndarray,
+        runtimes: np.ndarray,
+        destroy_operators: Sequence[str],
+        repair_operators: Sequence[str],
+        destroy_indices: np.ndarray,
+        repair_indices: np.ndarray,
+        outcomes: np.ndarray,
+    ) -> "Statistics":
+        """
+        Creates a statistics object from traces recorded during iteration,
+        computing the operator counts in a single vectorised pass.
+
+        Parameters
+        ----------
+        objectives
+            Objective values: that of the initial solution, followed by the
+            current solution's objective value after each iteration.
+        runtimes
+            Times (in seconds): the reference start time, followed by the time
+            at which each iteration completed.
+        destroy_operators
+            Destroy operator names, in the order the operators were passed to
+            the ALNS instance.
+        repair_operators
+            Repair operator names, in the order the operators were passed to
+            the ALNS instance.
+        destroy_indices
+            Index of the destroy operator applied in each iteration.
+        repair_indices
+            Index of the repair operator applied in each iteration.
+        outcomes
+            Outcome of each iteration.
+
+        Returns
+        -------
+        Statistics
+            The statistics object. Only operators that were applied at least
+            once have operator counts.
+        """
+        statistics = cls()
+        statistics._objectives = np.asarray(objectives).tolist()
+        statistics._runtimes = np.asarray(runtimes).tolist()
+
+        for name, op_counts in _count_outcomes(
+            destroy_operators, destroy_indices, outcomes
+        ):
+            statistics._destroy_operator_counts[name] = op_counts
+
+        for name, op_counts in _count_outcomes(
+            repair_operators, repair_indices, outcomes
+        ):
+            statistics._repair_operator_counts[name] = op_counts
+
+        return statistics
+
     @property
     def objectives(self) -> np.ndarray:
         """
@@ -130,3 +188,24 @@ class Statistics:
             Score enum value used for the various iteration outcomes.
         """
         self._repair_operator_counts[operator_name][outcome] += 1
+
+
+def _count_outcomes(
+    names: Sequence[str], indices: np.ndarray, outcomes: np.ndarray
+) -> List[Tuple[str, List[int]]]:
+    """
+    Counts how often each operator resulted in each outcome, and returns the
+    (name, counts) pairs of the operators that were applied at least once.
+    """
+    num_outcomes = len(Outcome)
+    flat_idcs = num_outcomes * np.asarray(indices, dtype=int)
+    flat_idcs += np.asarray(outcomes, dtype=int)
+
+    counts = np.bincount(flat_idcs, minlength=num_outcomes * len(names))
+    counts = counts.reshape(len(names), num_outcomes)
+
+    return [
+        (name, op_counts)
+        for name, op_counts in zip(names, counts.tolist())
+        if any(op_counts)
+    ]
@@ -1,4 +1,5 @@
 from .ALNS import ALNS
+from .BufferedGenerator import BufferedGenerator
 from .Result import Result
 from .State import State
 from .show_versions import show_versions
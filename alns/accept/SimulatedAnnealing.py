@@ -1,4 +1,5 @@
 import logging
+import math
 
 import numpy as np
 
@@ -99,9 +100,16 @@ class SimulatedAnnealing:
         return self._method
 
     def __call__(self, rng, best, current, candidate):
-        probability = np.exp(
-            (current.objective() - candidate.objective()) / self._temperature
-        )
+        delta = current.objective() - candidate.objective()
+
+        # An improving candidate is always accepted, so there is no need to
+        # compute its acceptance probability. We still draw a random number
+        # below, to keep the random number stream the same.
+        if delta >= 0:
+            probability = 1.0
+        else:
+            # math.exp is much cheaper than np.exp for a single float.
+            probability = math.exp(delta / self._temperature)
 
         # We should not set a temperature that is lower than the end
         # temperature.
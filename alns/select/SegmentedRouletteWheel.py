@@ -85,19 +85,28 @@ class SegmentedRouletteWheel(RouletteWheel):
             logger.debug(f"End of segment (#iters = {self._iter}).")
 
             self._d_weights *= self._decay
-            self._d_weights += (1 - self._decay) * self._d_seg_weights
+            self._d_weights += (1 - self._decay) * np.asarray(
+                self._d_seg_weights
+            )
 
             self._r_weights *= self._decay
-            self._r_weights += (1 - self._decay) * self._r_seg_weights
+            self._r_weights += (1 - self._decay) * np.asarray(
+                self._r_seg_weights
+            )
 
             self._reset_segment_weights()
 
         return super().__call__(rng, best, curr)
 
     def update(self, cand, d_idx, r_idx, outcome):
-        self._d_seg_weights[d_idx] += self._scores[outcome]
-        self._r_seg_weights[r_idx] += self._scores[outcome]
+        score = self._scores[outcome]
+        self._d_seg_weights[d_idx] += score
+        self._r_seg_weights[r_idx] += score
 
     def _reset_segment_weights(self):
-        self._d_seg_weights = np.zeros_like(self._d_weights)
-        self._r_seg_weights = np.zeros_like(self._r_weights)
+        # The segment scores are plain lists, since they are updated one
+        # element at a time in every iteration, which is much cheaper for
+        # lists than for arrays. The weights are only updated once per
+        # segment, using array operations.
+        self._d_seg_weights = [0.0] * len(self._d_weights)
+        self._r_seg_weights = [0.0] * len(self._r_weights)
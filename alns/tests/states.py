@@ -8,6 +8,21 @@ class VarObj:
         return self.obj
 
 
+class CustomerVarObj(VarObj):
+    """
+    Test solution state object with variable objective that also tracks the
+    unassigned customers, as used by the ALNS iteration logs.
+    """
+
+    def __init__(self, obj: float, unassigned: list = ()):
+        super().__init__(obj)
+        self.unassigned = list(unassigned)
+
+    @property
+    def cost(self) -> float:
+        return self.obj
+
+
 class ContextualVarObj:
     """Test solution state object with variable objective and context."""
 
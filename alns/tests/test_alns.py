@@ -1,3 +1,4 @@
+import numpy as np
 import numpy.random as rnd
 from numpy.testing import (
     assert_,
@@ -8,11 +9,11 @@ from numpy.testing import (
 from pytest import mark
 
 from alns import ALNS
-from alns.accept import HillClimbing, SimulatedAnnealing
+from alns.accept import AlwaysAccept, HillClimbing, SimulatedAnnealing
 from alns.select import RouletteWheel
 from alns.stop import MaxIterations, MaxRuntime
 
-from .states import One, VarObj, Zero
+from .states import CustomerVarObj, One, VarObj, Zero
 
 # HELPERS ---------------------------------------------------------------------
 
@@ -84,7 +85,9 @@ def test_on_best_is_called():
     alns.on_best(callback)
 
     select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
-    result = alns.iterate(VarObj(10), select, HillClimbing(), MaxIterations(1))
+    result, *_ = alns.iterate(
+        VarObj(10), select, HillClimbing(), MaxIterations(1)
+    )
 
     assert_equal(result.best_state.objective(), 1)
 
@@ -179,6 +182,202 @@ def test_add_repair_operator_name():
     assert_(operator is repair_operator)
 
 
+def test_destroy_operator_receives_clone_of_cloneable_state():
+    """
+    Tests that the destroy operator receives a clone of the current solution
+    when the solution state implements clone(), so it may modify that clone
+    in-place.
+    """
+
+    class CloneableState(CustomerVarObj):
+        def clone(self):
+            return CloneableState(self.obj, self.unassigned)
+
+    def destroy(state, rng):
+        assert_(state is not init_sol)
+        state.unassigned.append(1)
+        return state
+
+    alns = get_alns_instance([lambda state, rng: state], [destroy])
+
+    init_sol = CloneableState(1)
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    alns.iterate(init_sol, select, HillClimbing(), MaxIterations(1))
+
+    assert_equal(init_sol.unassigned, [])
+
+
+def test_add_fused_operator():
+    """
+    Tests if adding a fused operator registers it for the given pair of
+    destroy and repair operators.
+    """
+
+    def fused_operator():  # placeholder
+        pass
+
+    alns = get_alns_instance([lambda state, rng: state] * 2, [lambda: None])
+    alns.add_fused_operator(fused_operator, "0", "1")
+
+    pair, operator = alns.fused_operators[0]
+
+    assert_equal(pair, ("0", "1"))
+    assert_(operator is fused_operator)
+
+
+def test_add_fused_operator_raises_unknown_operators():
+    """
+    Tests that a fused operator can only be added for destroy and repair
+    operators that have been added already.
+    """
+    alns = get_alns_instance([lambda: None], [lambda: None])
+
+    with assert_raises(ValueError):
+        alns.add_fused_operator(lambda: None, "1", "0")
+
+    with assert_raises(ValueError):
+        alns.add_fused_operator(lambda: None, "0", "1")
+
+
+def test_add_fused_operator_raises_when_tracking_deltas():
+    """
+    Tests that fused operators cannot be combined with operator delta
+    tracking, which requires the intermediate destroyed state.
+    """
+    alns = ALNS(track_operator_deltas=True)
+    alns.add_destroy_operator(lambda: None, "destroy")
+    alns.add_repair_operator(lambda: None, "repair")
+
+    with assert_raises(ValueError):
+        alns.add_fused_operator(lambda: None, "destroy", "repair")
+
+
+def test_fused_operator_replaces_selected_pair():
+    """
+    Tests that the fused operator is applied instead of its destroy and
+    repair operators whenever that pair is selected, and that other pairs
+    still use the separate operators.
+    """
+    calls = dict(destroy=0, repair=0, fused=0)
+
+    def make_operator(key):
+        def operator(state, rng):
+            calls[key] += 1
+            return state
+
+        return operator
+
+    alns = get_alns_instance(
+        [make_operator("repair")],
+        [make_operator("destroy"), make_operator("destroy")],
+        seed=1,
+    )
+    alns.add_fused_operator(make_operator("fused"), "1", "0")
+
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 2, 1)
+    result, *_ = alns.iterate(
+        CustomerVarObj(1), select, HillClimbing(), MaxIterations(100)
+    )
+
+    counts = result.statistics.destroy_operator_counts
+    assert_equal(calls["fused"], sum(counts["1"]))
+    assert_equal(calls["destroy"], sum(counts["0"]))
+    assert_equal(calls["repair"], sum(counts["0"]))
+
+
+def test_operator_deltas_are_only_tracked_when_requested():
+    """
+    Tests that the number of customers removed and inserted per iteration is
+    only logged when ALNS is constructed with track_operator_deltas=True.
+    """
+
+    def destroy(state, rng):
+        return CustomerVarObj(state.obj, [*state.unassigned, 1, 2])
+
+    def repair(state, rng):
+        return CustomerVarObj(state.obj, state.unassigned[:-1])
+
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+
+    alns = get_alns_instance([repair], [destroy])
+    _, removed, inserted, *_ = alns.iterate(
+        CustomerVarObj(1), select, HillClimbing(), MaxIterations(3)
+    )
+
+    assert_(removed is None)
+    assert_(inserted is None)
+
+    alns = ALNS(rnd.default_rng(1), track_operator_deltas=True)
+    alns.add_destroy_operator(destroy)
+    alns.add_repair_operator(repair)
+    _, removed, inserted, *_ = alns.iterate(
+        CustomerVarObj(1), select, HillClimbing(), MaxIterations(3)
+    )
+
+    assert_equal(removed, [2, 2, 2])
+    assert_equal(inserted, [1, 1, 1])
+
+
+def test_cost_per_iter_logs_current_solution_cost():
+    """
+    Tests that the (fractional) cost of the current solution is logged after
+    each iteration, and that rejected candidates do not change it.
+    """
+    costs = iter([100.53, 150.25, 99.75])
+
+    alns = get_alns_instance(
+        [lambda state, rng: CustomerVarObj(next(costs))],
+        [lambda state, rng: state],
+    )
+
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    *_, cost_per_iter = alns.iterate(
+        CustomerVarObj(200), select, HillClimbing(), MaxIterations(3)
+    )
+
+    assert_equal(cost_per_iter.dtype, np.float64)
+    assert_almost_equal(cost_per_iter, [100.53, 100.53, 99.75])
+
+
+def test_cost_per_iter_is_nan_for_states_without_cost():
+    """
+    Tests that states are not required to have a cost: NaN is logged instead.
+    """
+    alns = get_alns_instance(
+        [lambda state, rng: VarObj(state.obj - 1)],
+        [lambda state, rng: state],
+    )
+
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    *_, cost_per_iter = alns.iterate(
+        VarObj(10), select, HillClimbing(), MaxIterations(2)
+    )
+
+    assert_(np.isnan(cost_per_iter).all())
+
+
+def test_save_plots_raises_plotting_errors(tmp_path):
+    """
+    Tests that errors raised while rendering plots in the background are not
+    lost, but raised by iterate().
+    """
+    alns = get_alns_instance(
+        [lambda state, rng: state], [lambda state, rng: state]
+    )
+
+    # CustomerVarObj has no nodes_df, so it cannot be plotted.
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    with assert_raises(AttributeError):
+        alns.iterate(
+            CustomerVarObj(1),
+            select,
+            HillClimbing(),
+            MaxIterations(1),
+            save_plots=True,
+            printdir=str(tmp_path),
+        )
+
+
 # PARAMETERS ------------------------------------------------------------------
 
 
@@ -222,7 +421,7 @@ def test_zero_max_iterations():
     initial_solution = One()
     select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
 
-    result = alns.iterate(
+    result, *_ = alns.iterate(
         initial_solution, select, HillClimbing(), MaxIterations(0)
     )
 
@@ -241,7 +440,7 @@ def test_zero_max_runtime():
     initial_solution = One()
     select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
 
-    result = alns.iterate(
+    result, *_ = alns.iterate(
         initial_solution, select, HillClimbing(), MaxRuntime(0)
     )
 
@@ -286,6 +485,127 @@ def test_bugfix_pass_kwargs_to_on_best():
     )
 
 
+def test_raises_negative_eval_cache_size():
+    with assert_raises(ValueError):
+        ALNS(eval_cache_size=-1)
+
+
+# EVALUATION CACHE ------------------------------------------------------------
+
+
+class CountingState(CustomerVarObj):
+    """
+    Fingerprinted test state that records its objective evaluations.
+    """
+
+    evaluations = 0
+
+    def objective(self) -> float:
+        CountingState.evaluations += 1
+        return self.obj
+
+    def fingerprint(self):
+        return self.obj
+
+
+@mark.parametrize("eval_cache_size,evaluations", [(0, 11), (10, 2)])
+def test_eval_cache_reuses_objective_of_seen_candidates(
+    eval_cache_size: int, evaluations: int
+):
+    """
+    Tests that the objective of a candidate that was seen before is taken from
+    the evaluation cache, rather than recomputed.
+    """
+    alns = ALNS(rnd.default_rng(1), eval_cache_size=eval_cache_size)
+    alns.add_destroy_operator(lambda state, rng: state)
+    alns.add_repair_operator(lambda state, rng: CountingState(1))
+
+    CountingState.evaluations = 0
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    alns.iterate(CountingState(2), select, AlwaysAccept(), MaxIterations(10))
+
+    assert_equal(CountingState.evaluations, evaluations)
+
+
+def test_eval_cache_is_disabled_by_default():
+    """
+    Tests that the evaluation cache is disabled by default, so every
+    candidate is evaluated.
+    """
+    alns = get_alns_instance(
+        [lambda state, rng: CountingState(1)], [lambda state, rng: state]
+    )
+
+    CountingState.evaluations = 0
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    alns.iterate(CountingState(2), select, AlwaysAccept(), MaxIterations(10))
+
+    assert_equal(CountingState.evaluations, 11)
+
+
+@mark.parametrize("eval_cache_size,evaluations", [(0, 31), (10, 22)])
+def test_eval_cache_with_criterion_that_evaluates_states(
+    eval_cache_size: int, evaluations: int
+):
+    """
+    Tests that the evaluation cache only replaces ALNS' own evaluation of a
+    candidate: HillClimbing evaluates the current and candidate solutions
+    itself in every iteration, cache or not.
+    """
+    alns = ALNS(rnd.default_rng(1), eval_cache_size=eval_cache_size)
+    alns.add_destroy_operator(lambda state, rng: state)
+    alns.add_repair_operator(lambda state, rng: CountingState(1))
+
+    CountingState.evaluations = 0
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    alns.iterate(CountingState(2), select, HillClimbing(), MaxIterations(10))
+
+    # One evaluation of the initial solution, plus two per iteration by the
+    # criterion. Without cache, ALNS evaluates each of the ten candidates as
+    # well; with cache, only the first.
+    assert_equal(CountingState.evaluations, evaluations)
+
+
+def test_eval_cache_is_seeded_with_initial_solution():
+    """
+    Tests that candidates identical to the initial solution are never
+    evaluated, since the initial solution's objective is cached as well.
+    """
+    alns = ALNS(rnd.default_rng(1), eval_cache_size=10)
+    alns.add_destroy_operator(lambda state, rng: state)
+    alns.add_repair_operator(lambda state, rng: CountingState(2))
+
+    CountingState.evaluations = 0
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    alns.iterate(CountingState(2), select, AlwaysAccept(), MaxIterations(10))
+
+    assert_equal(CountingState.evaluations, 1)
+
+
+@mark.parametrize("eval_cache_size,evaluations", [(1, 11), (2, 3)])
+def test_eval_cache_evicts_least_recently_used(
+    eval_cache_size: int, evaluations: int
+):
+    """
+    Tests that the evaluation cache holds at most eval_cache_size objectives:
+    when alternating between two candidates, a cache of size one always
+    misses.
+    """
+    objectives = iter([1, 0.5] * 5)
+
+    alns = ALNS(rnd.default_rng(1), eval_cache_size=eval_cache_size)
+    alns.add_destroy_operator(lambda state, rng: state)
+    alns.add_repair_operator(
+        lambda state, rng: CountingState(next(objectives))
+    )
+
+    CountingState.evaluations = 0
+    select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
+    alns.iterate(CountingState(2), select, AlwaysAccept(), MaxIterations(10))
+
+    assert_equal(CountingState.evaluations, evaluations)
+
+
 # EXAMPLES --------------------------------------------------------------------
 
 
@@ -299,7 +619,9 @@ def test_trivial_example():
     )
 
     select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
-    result = alns.iterate(One(), select, HillClimbing(), MaxIterations(100))
+    result, *_ = alns.iterate(
+        One(), select, HillClimbing(), MaxIterations(100)
+    )
 
     assert_equal(result.best_state.objective(), 0)
 
@@ -319,7 +641,7 @@ def test_fixed_seed_outcomes(seed: int, desired: float):
     select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
     sa = SimulatedAnnealing(1, 0.25, 1 / 100)
 
-    result = alns.iterate(One(), select, sa, MaxIterations(100))
+    result, *_ = alns.iterate(One(), select, sa, MaxIterations(100))
     assert_almost_equal(result.best_state.objective(), desired, decimal=5)
 
 
@@ -335,7 +657,7 @@ def test_nonnegative_max_iterations(max_iterations):
     initial_solution = One()
     select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
 
-    result = alns.iterate(
+    result, *_ = alns.iterate(
         initial_solution,
         select,
         HillClimbing(),
@@ -358,7 +680,7 @@ def test_nonnegative_max_runtime(max_runtime):
     initial_solution = One()
     select = RouletteWheel([1, 1, 1, 1], 0.5, 1, 1)
 
-    result = alns.iterate(
+    result, *_ = alns.iterate(
         initial_solution, select, HillClimbing(), MaxRuntime(max_runtime)
     )
 
@@ -0,0 +1,78 @@
+import copy
+
+import numpy.random as rnd
+from numpy.testing import assert_, assert_allclose, assert_equal, assert_raises
+from pytest import mark
+
+from alns import BufferedGenerator
+
+
+@mark.parametrize("buffer_size", [-1, 0])
+def test_raises_invalid_buffer_size(buffer_size: int):
+    with assert_raises(ValueError):
+        BufferedGenerator(rnd.default_rng(1), buffer_size)
+
+
+@mark.parametrize("buffer_size", [1, 10, 4096])
+def test_random_matches_wrapped_generator(buffer_size: int):
+    """
+    Tests that scalar draws from the buffer are the same numbers, in the same
+    order, as drawing from the wrapped generator directly, also across buffer
+    refills.
+    """
+    rng = BufferedGenerator(rnd.default_rng(1), buffer_size)
+    values = [rng.random() for _ in range(100)]
+
+    assert_(all(isinstance(value, float) for value in values))
+    assert_allclose(values, rnd.default_rng(1).random(100))
+
+
+def test_random_with_size_is_forwarded():
+    rng = BufferedGenerator(rnd.default_rng(1))
+    assert_allclose(rng.random(5), rnd.default_rng(1).random(5))
+
+
+@mark.parametrize(
+    "low,high,endpoint,expected",
+    [
+        (3, None, False, {0, 1, 2}),
+        (2, 4, False, {2, 3}),
+        (2, 4, True, {2, 3, 4}),
+    ],
+)
+def test_integers(low, high, endpoint, expected):
+    """
+    Tests that buffered integer draws cover exactly the requested range.
+    """
+    rng = BufferedGenerator(rnd.default_rng(1))
+    draws = {rng.integers(low, high, endpoint=endpoint) for _ in range(1_000)}
+
+    assert_equal(draws, expected)
+
+
+def test_integers_raises_empty_range():
+    rng = BufferedGenerator(rnd.default_rng(1))
+
+    with assert_raises(ValueError):
+        rng.integers(2, 2)
+
+
+def test_other_methods_are_forwarded():
+    wrapped = rnd.default_rng(1)
+    rng = BufferedGenerator(wrapped)
+
+    assert_(rng.bit_generator is wrapped.bit_generator)
+
+    choices = rng.choice(10, size=5)
+    assert_equal(choices, rnd.default_rng(1).choice(10, size=5))
+
+
+def test_copy():
+    """
+    Tests that a copy continues the same random number stream.
+    """
+    rng = BufferedGenerator(rnd.default_rng(1))
+    rng.random()
+
+    copied = copy.deepcopy(rng)
+    assert_equal(copied.random(), rng.random())
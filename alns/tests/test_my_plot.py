@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+
+import pytest
+from numpy.testing import assert_almost_equal, assert_equal
+
+from alns.My_plot import plot_solution
+
+pd = pytest.importorskip("pandas")
+Figure = pytest.importorskip("matplotlib.figure").Figure
+
+
+# HELPERS ---------------------------------------------------------------------
+
+
+def get_solution(routes=([10, 2, 1, 10], [10, 4, 3, 10])):
+    """
+    Test helper method. The nodes are not stored in label order, and the depot
+    has label 10, so labels and row positions differ.
+    """
+    nodes_df = pd.DataFrame(
+        {
+            "x": [4.0, 10.0, 2.0, 0.0, 3.0, 1.0],
+            "y": [4.5, 0.5, 2.5, 1.5, 3.5, 5.5],
+        },
+        index=[4, 10, 2, 0, 3, 1],
+    )
+
+    return SimpleNamespace(
+        nodes_df=nodes_df,
+        routes=[
+            SimpleNamespace(vehicle=idx, customers_list=list(route))
+            for idx, route in enumerate(routes)
+        ],
+        n_customers=4,
+        depots={"depots_indices": [10], "coords": [(10.0, 0.5)]},
+        cost=12.5,
+        unassigned=[],
+    )
+
+
+def get_axes():
+    """
+    Test helper method.
+    """
+    return Figure().subplots()
+
+
+# ROUTES ----------------------------------------------------------------------
+
+
+def test_route_coordinates_follow_index_labels():
+    """
+    Tests that each route is drawn through the coordinates of its locations,
+    which are looked up by their index label rather than row position.
+    """
+    solution = get_solution()
+    ax = get_axes()
+    plot_solution(solution, ax=ax)
+
+    # Route lines are drawn first, followed by the depots.
+    assert_equal(len(ax.lines), len(solution.routes) + 1)
+
+    for line, route in zip(ax.lines, solution.routes):
+        expected = solution.nodes_df.loc[route.customers_list, ["x", "y"]]
+        assert_almost_equal(line.get_xydata(), expected.to_numpy())
+
+
+# CUSTOMERS -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "cordeau,customers", [(True, [1, 2, 3, 4]), (False, [0, 1, 2, 3, 4])]
+)
+def test_customers_are_drawn_as_single_scatter(cordeau, customers):
+    """
+    Tests that all customers are drawn by a single scatter, at the coordinates
+    of their index labels. The first customer is skipped when cordeau is set.
+    """
+    solution = get_solution()
+    ax = get_axes()
+    plot_solution(solution, cordeau=cordeau, ax=ax)
+
+    assert_equal(len(ax.collections), 1)
+
+    expected = solution.nodes_df.loc[customers, ["x", "y"]].to_numpy()
+    assert_almost_equal(ax.collections[0].get_offsets(), expected)
+
+
+# AXES REUSE ------------------------------------------------------------------
+
+
+def test_reused_axes_only_hold_the_latest_plot():
+    """
+    Tests that passed-in axes are cleared before drawing, so axes reused for
+    many plots only ever hold the artists of a single plot.
+    """
+    ax = get_axes()
+    plot_solution(get_solution(), ax=ax)
+    plot_solution(get_solution(routes=([10, 1, 2, 3, 4, 10],)), ax=ax)
+
+    # One route and one depot line, and a single customer scatter.
+    assert_equal(len(ax.lines), 2)
+    assert_equal(len(ax.collections), 1)
+
+    expected = get_solution().nodes_df.loc[[10, 1, 2, 3, 4, 10], ["x", "y"]]
+    assert_almost_equal(ax.lines[0].get_xydata(), expected.to_numpy())
+
+
+# ERRORS ----------------------------------------------------------------------
+
+
+def test_unknown_location_raises():
+    """
+    Tests that a route visiting a location that is not in nodes_df raises,
+    rather than silently plotting the coordinates of another location.
+    """
+    solution = get_solution(routes=([10, 2, 7, 10],))
+
+    with pytest.raises(KeyError, match="7"):
+        plot_solution(solution, ax=get_axes())
@@ -1,7 +1,7 @@
 import numpy as np
 import numpy.random as rnd
 import pytest
-from numpy.testing import assert_
+from numpy.testing import assert_, assert_equal
 
 from alns.Result import Result
 from alns.Statistics import Statistics
@@ -125,6 +125,28 @@ def test_result_state():
     assert_(get_result(best).best_state is best)
 
 
+def test_to_dense():
+    """
+    Tests if operator events are correctly expanded into a dense matrix, with
+    one column per operator.
+    """
+    indices = np.array([0, 2, 0, 1], dtype=np.uint8)
+    counts = np.array([2, 1, 3, 0], dtype=np.int32)
+    dense = Result.to_dense(indices, counts, 3)
+
+    assert_equal(dense.dtype, counts.dtype)
+    assert_equal(dense, [[2, 0, 0], [0, 0, 1], [3, 0, 0], [0, 0, 0]])
+
+
+def test_to_dense_no_events():
+    """
+    Tests if expanding an empty log results in an empty matrix with the
+    appropriate number of columns.
+    """
+    dense = Result.to_dense(np.empty(0, dtype=int), np.empty(0, dtype=int), 2)
+    assert_equal(dense.shape, (0, 2))
+
+
 @pytest.mark.matplotlib
 @check_figures_equal(extensions=["png"])
 def test_plot_objectives(fig_test, fig_ref):
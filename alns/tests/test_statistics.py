@@ -1,3 +1,5 @@
+import numpy as np
+import numpy.random as rnd
 from numpy.testing import assert_allclose, assert_almost_equal, assert_equal
 
 from alns.Statistics import Statistics
@@ -98,3 +100,48 @@ def test_collect_repair_counts_example():
         assert_equal(
             statistics.repair_operator_counts["repair_test"][idx], count
         )
+
+
+def test_from_traces_matches_collected_statistics():
+    """
+    Tests if creating a Statistics object from per-iteration traces results in
+    the same statistics as collecting them one iteration at a time.
+    """
+    rng = rnd.default_rng(1)
+
+    objectives = rng.random(51)
+    runtimes = np.cumsum(rng.random(51))
+    d_idcs = rng.integers(3, size=50)
+    r_idcs = rng.integers(2, size=50)
+    outcomes = rng.integers(4, size=50)
+
+    collected = Statistics()
+    collected.collect_objective(objectives[0])
+    collected.collect_runtime(runtimes[0])
+
+    for it in range(50):
+        collected.collect_objective(objectives[it + 1])
+        collected.collect_destroy_operator(f"d{d_idcs[it]}", outcomes[it])
+        collected.collect_repair_operator(f"r{r_idcs[it]}", outcomes[it])
+        collected.collect_runtime(runtimes[it + 1])
+
+    traced = Statistics.from_traces(
+        objectives,
+        runtimes,
+        ["d0", "d1", "d2", "d3"],  # d3 is never used
+        ["r0", "r1"],
+        d_idcs,
+        r_idcs,
+        outcomes,
+    )
+
+    assert_allclose(traced.objectives, collected.objectives)
+    assert_allclose(traced.runtimes, collected.runtimes)
+    assert_equal(
+        dict(traced.destroy_operator_counts),
+        dict(collected.destroy_operator_counts),
+    )
+    assert_equal(
+        dict(traced.repair_operator_counts),
+        dict(collected.repair_operator_counts),
+    )